@@ -6,12 +6,29 @@ Edited on 2024/10/31
 """
 
 # Import libraries
+import hashlib
 import logging
 import ctypes
+import os
 import sys
 import geopandas as gpd
+import pandas as pd
 import matplotlib.pyplot as plt
-from PyQt5.QtCore import Qt
+import numpy as np
+import shapely
+from shapely.geometry import box
+from PyQt5.QtCore import (
+    Qt,
+    QAbstractTableModel,
+    QEventLoop,
+    QModelIndex,
+    QObject,
+    QRunnable,
+    QThread,
+    QThreadPool,
+    QTimer,
+    pyqtSignal,
+)
 from PyQt5.QtGui import QIcon
 from PyQt5.QtWidgets import (
     QApplication,
@@ -26,10 +43,11 @@ from PyQt5.QtWidgets import (
     QDialog,
     QTextEdit,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
+    QHeaderView,
     QSizePolicy,
 )
+from matplotlib.collections import LineCollection, PolyCollection
 from matplotlib.backends.backend_qt5agg import (
     FigureCanvasQTAgg as FigureCanvas,
 )
@@ -41,6 +59,234 @@ ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(
     "bnu.banyangis.v1.3"
 )
 
+# Prefer the vectorized pyogrio IO engine (with the Arrow stream interface)
+# over fiona; it reads features in bulk instead of row-by-row in Python.
+# Fall back to fiona when pyogrio/pyarrow are not installed.
+try:
+    import pyogrio  # noqa: F401
+    import pyarrow  # noqa: F401
+
+    gpd.options.io_engine = "pyogrio"
+    _HAS_PYOGRIO = True
+except ImportError:
+    _HAS_PYOGRIO = False
+
+
+# Optional pyqtgraph backend for the map view; Qt-native (optionally
+# OpenGL-accelerated) rendering avoids re-rasterizing the whole scene
+# through Agg on every pan/zoom. Falls back to matplotlib when absent.
+try:
+    import pyqtgraph as pg
+
+    pg.setConfigOption("useOpenGL", True)
+    pg.setConfigOption("background", "w")
+    pg.setConfigOption("foreground", "k")
+    _HAS_PYQTGRAPH = True
+except ImportError:
+    _HAS_PYQTGRAPH = False
+
+
+def read_vector_file(path, **kwargs):
+    """Reads a vector file, using the pyogrio engine when available."""
+    if _HAS_PYOGRIO:
+        return gpd.read_file(path, engine="pyogrio", use_arrow=True, **kwargs)
+    return gpd.read_file(path, **kwargs)
+
+
+# Optional numba kernels for clipping against a single convex polygon;
+# they bypass GEOS' per-call dispatch and robustness machinery, which
+# dominate when the clip window is simple. Optional like rasterio.
+try:
+    from numba import njit, prange
+
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+if _HAS_NUMBA:
+
+    @njit(cache=True)
+    def _sh_clip_ring(ring, clip_ring, buf_a, buf_b):
+        """Sutherland-Hodgman clip of one ring against a convex CCW ring.
+
+        Writes the result into buf_a and returns its vertex count.
+        """
+        count = ring.shape[0]
+        for i in range(count):
+            buf_a[i, 0] = ring[i, 0]
+            buf_a[i, 1] = ring[i, 1]
+        for e in range(clip_ring.shape[0] - 1):
+            ex = clip_ring[e + 1, 0] - clip_ring[e, 0]
+            ey = clip_ring[e + 1, 1] - clip_ring[e, 1]
+            ox = clip_ring[e, 0]
+            oy = clip_ring[e, 1]
+            out_count = 0
+            px = buf_a[count - 1, 0]
+            py = buf_a[count - 1, 1]
+            prev_side = ex * (py - oy) - ey * (px - ox)
+            for i in range(count):
+                cx = buf_a[i, 0]
+                cy = buf_a[i, 1]
+                cur_side = ex * (cy - oy) - ey * (cx - ox)
+                if cur_side >= 0.0:
+                    if prev_side < 0.0:
+                        t = prev_side / (prev_side - cur_side)
+                        buf_b[out_count, 0] = px + t * (cx - px)
+                        buf_b[out_count, 1] = py + t * (cy - py)
+                        out_count += 1
+                    buf_b[out_count, 0] = cx
+                    buf_b[out_count, 1] = cy
+                    out_count += 1
+                elif prev_side >= 0.0:
+                    t = prev_side / (prev_side - cur_side)
+                    buf_b[out_count, 0] = px + t * (cx - px)
+                    buf_b[out_count, 1] = py + t * (cy - py)
+                    out_count += 1
+                px = cx
+                py = cy
+                prev_side = cur_side
+            for i in range(out_count):
+                buf_a[i, 0] = buf_b[i, 0]
+                buf_a[i, 1] = buf_b[i, 1]
+            count = out_count
+            if count == 0:
+                break
+        return count
+
+    @njit(parallel=True, cache=True)
+    def _sh_clip_all(
+        coords, offsets, clip_ring, out_coords, out_offsets, out_counts
+    ):
+        """Clips every exterior ring in the flat coordinate array."""
+        n_geom = offsets.shape[0] - 1
+        extra = clip_ring.shape[0] + 4
+        for g in prange(n_geom):
+            start = offsets[g]
+            n = offsets[g + 1] - start
+            buf_a = np.empty((n + extra, 2))
+            buf_b = np.empty((n + extra, 2))
+            cnt = _sh_clip_ring(
+                coords[start : start + n], clip_ring, buf_a, buf_b
+            )
+            out_start = out_offsets[g]
+            for i in range(cnt):
+                out_coords[out_start + i, 0] = buf_a[i, 0]
+                out_coords[out_start + i, 1] = buf_a[i, 1]
+            out_counts[g] = cnt
+
+
+def _clip_convex_fast(gdf, clip_gdf):
+    """Clips a convex, hole-free polygon layer against a single convex
+    polygon using the parallel numba Sutherland-Hodgman kernel.
+
+    Both sides must be convex: a concave subject can cross one clip
+    edge many times (overflowing the n + m output bound the buffers are
+    sized for) and can be split into disjoint pieces, which a single
+    Sutherland-Hodgman ring cannot represent. Returns None when any
+    precondition doesn't hold (no numba, multiple/concave clip
+    features, concave subjects, holes, non-polygon geometries) so the
+    caller can fall back to a GEOS clip.
+    """
+    if not _HAS_NUMBA or len(clip_gdf) != 1 or len(gdf) == 0:
+        return None
+    clip_poly = clip_gdf.geometry.iloc[0]
+    if clip_poly.geom_type != "Polygon" or not clip_poly.is_valid:
+        return None
+    # Sutherland-Hodgman is only correct for convex clip windows
+    if not clip_poly.equals(clip_poly.convex_hull):
+        return None
+    if not (set(gdf.geom_type) <= {"Polygon"}):
+        return None
+    geoms = np.asarray(gdf.geometry.values)
+    if shapely.get_num_interior_rings(geoms).max() > 0:
+        return None
+    # Convex subjects only; GEOS equals() ignores collinear vertices
+    if not shapely.equals(geoms, shapely.convex_hull(geoms)).all():
+        return None
+
+    try:
+        from shapely.geometry.polygon import orient
+
+        # Kernel expects a counter-clockwise closed clip ring
+        clip_ring = np.asarray(orient(clip_poly).exterior.coords)
+        coords, idx = shapely.get_coordinates(geoms, return_index=True)
+        counts = np.bincount(idx, minlength=len(geoms))
+        offsets = np.zeros(len(geoms) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+
+        # A convex ring clipped by a convex window has at most n + m
+        # vertices; preallocate slots so the kernel writes without
+        # resizing (this bound is why concave subjects are rejected)
+        extra = clip_ring.shape[0] + 4
+        out_offsets = offsets[:-1] + np.arange(len(geoms)) * extra
+        out_coords = np.empty((coords.shape[0] + len(geoms) * extra, 2))
+        out_counts = np.zeros(len(geoms), dtype=np.int64)
+        _sh_clip_all(
+            coords, offsets, clip_ring, out_coords, out_offsets, out_counts
+        )
+
+        # Anything reduced below a triangle is dropped
+        keep = np.where(out_counts >= 3)[0]
+        out = gdf.iloc[keep].copy()
+        if len(keep):
+            parts = [
+                out_coords[out_offsets[g] : out_offsets[g] + out_counts[g]]
+                for g in keep
+            ]
+            indices = np.repeat(np.arange(len(keep)), out_counts[keep])
+            rings = shapely.linearrings(
+                np.concatenate(parts), indices=indices
+            )
+            out["geometry"] = gpd.GeoSeries(
+                shapely.polygons(rings), index=out.index, crs=gdf.crs
+            )
+        return out
+    except Exception as e:
+        logging.error(f"Numba clip fast path failed: {e}", exc_info=True)
+        return None
+
+
+def _clip_vectorized(gdf, clip_gdf):
+    """Clips a layer with an STRtree prefilter and the intersection ufunc.
+
+    The clip geometries are unioned into one mask first, matching
+    GeoDataFrame.clip, so each subject row appears at most once even
+    when the clip layer has many (possibly overlapping) features. The
+    tree then prunes to candidates in O(log N + k) and one batched
+    shapely.intersection call replaces the per-geometry Python loop
+    inside GeoDataFrame.clip.
+    """
+    mask_geom = shapely.union_all(np.asarray(clip_gdf.geometry.values))
+    tree = shapely.STRtree(gdf.geometry.values)
+    idx = tree.query(mask_geom, predicate="intersects")
+    if len(idx) == 0:
+        return gdf.iloc[[]].copy()
+    # Sorting preserves the original row order
+    idx = np.sort(idx)
+    subjects = np.asarray(gdf.geometry.values)[idx]
+    intersections = shapely.intersection(subjects, mask_geom)
+    out = gdf.iloc[idx].copy()
+    out["geometry"] = gpd.GeoSeries(
+        intersections, index=out.index, crs=gdf.crs
+    )
+    # Boundary-touching subjects can produce empty results; drop them
+    return out[~shapely.is_empty(intersections)]
+
+
+# Directory for the GeoParquet read cache
+_CACHE_DIR = "cache"
+
+
+def _cached_parquet_path(path):
+    """Cache file for a source path, keyed on the path and its mtime.
+
+    A modified source file gets a different key, so stale cache entries
+    are never read back.
+    """
+    raw = path.encode() + str(os.path.getmtime(path)).encode()
+    key = hashlib.sha1(raw).hexdigest()
+    return os.path.join(_CACHE_DIR, f"{key}.parquet")
+
 # Set the Chinese font to SimHei
 plt.rcParams["font.sans-serif"] = ["SimHei"]  # SimHei font
 # Fix for displaying minus signs in axes
@@ -66,11 +312,355 @@ def handle_exception(e):
         update_label_visibility(None)
 
         # Update the canvas
-        self.main_window.canvas.draw()
+        self.main_window.canvas.draw_idle()
     except Exception as e:
         handle_exception(e)
 
 
+# Fast projection helpers: closed-form NumPy reprojection for the most
+# common CRS pairs, bypassing pyproj's per-point transform dispatch
+
+
+# WGS84 ellipsoid constants
+_WGS84_A = 6378137.0
+_WGS84_F = 1 / 298.257223563
+_WGS84_E2 = _WGS84_F * (2 - _WGS84_F)
+_WGS84_E = np.sqrt(_WGS84_E2)
+
+# Polar stereographic parameters: (standard parallel, central meridian,
+# sign: +1 north pole aspect, -1 south pole aspect)
+_POLAR_PARAMS = {
+    3413: (70.0, -45.0, 1.0),
+    3031: (-71.0, 0.0, -1.0),
+}
+
+
+def _is_fast_epsg(epsg):
+    """Whether the EPSG code has a closed-form fast projection path."""
+    if epsg in _POLAR_PARAMS:
+        return True
+    return 32601 <= epsg <= 32660 or 32701 <= epsg <= 32760
+
+
+def _utm_forward(lon, lat, epsg):
+    """WGS84 lon/lat arrays (degrees) to UTM easting/northing."""
+    zone = epsg % 100
+    south = 32701 <= epsg <= 32760
+    k0 = 0.9996
+    e2 = _WGS84_E2
+    ep2 = e2 / (1 - e2)
+    phi = np.radians(lat)
+    lam = np.radians(lon)
+    lam0 = np.radians(6 * zone - 183)
+
+    sin_phi = np.sin(phi)
+    cos_phi = np.cos(phi)
+    n = _WGS84_A / np.sqrt(1 - e2 * sin_phi**2)
+    t = np.tan(phi) ** 2
+    c = ep2 * cos_phi**2
+    a_ = cos_phi * (lam - lam0)
+    m = _WGS84_A * (
+        (1 - e2 / 4 - 3 * e2**2 / 64 - 5 * e2**3 / 256) * phi
+        - (3 * e2 / 8 + 3 * e2**2 / 32 + 45 * e2**3 / 1024) * np.sin(2 * phi)
+        + (15 * e2**2 / 256 + 45 * e2**3 / 1024) * np.sin(4 * phi)
+        - (35 * e2**3 / 3072) * np.sin(6 * phi)
+    )
+    x = (
+        k0
+        * n
+        * (
+            a_
+            + (1 - t + c) * a_**3 / 6
+            + (5 - 18 * t + t**2 + 72 * c - 58 * ep2) * a_**5 / 120
+        )
+        + 500000.0
+    )
+    y = k0 * (
+        m
+        + n
+        * np.tan(phi)
+        * (
+            a_**2 / 2
+            + (5 - t + 9 * c + 4 * c**2) * a_**4 / 24
+            + (61 - 58 * t + t**2 + 600 * c - 330 * ep2) * a_**6 / 720
+        )
+    )
+    if south:
+        y = y + 10000000.0
+    return x, y
+
+
+def _utm_inverse(x, y, epsg):
+    """UTM easting/northing arrays to WGS84 lon/lat (degrees)."""
+    zone = epsg % 100
+    south = 32701 <= epsg <= 32760
+    k0 = 0.9996
+    e2 = _WGS84_E2
+    ep2 = e2 / (1 - e2)
+    lam0 = np.radians(6 * zone - 183)
+
+    y = y - 10000000.0 if south else y
+    m = y / k0
+    mu = m / (_WGS84_A * (1 - e2 / 4 - 3 * e2**2 / 64 - 5 * e2**3 / 256))
+    e1 = (1 - np.sqrt(1 - e2)) / (1 + np.sqrt(1 - e2))
+    phi1 = (
+        mu
+        + (3 * e1 / 2 - 27 * e1**3 / 32) * np.sin(2 * mu)
+        + (21 * e1**2 / 16 - 55 * e1**4 / 32) * np.sin(4 * mu)
+        + (151 * e1**3 / 96) * np.sin(6 * mu)
+        + (1097 * e1**4 / 512) * np.sin(8 * mu)
+    )
+    sin_phi1 = np.sin(phi1)
+    cos_phi1 = np.cos(phi1)
+    t1 = np.tan(phi1) ** 2
+    c1 = ep2 * cos_phi1**2
+    n1 = _WGS84_A / np.sqrt(1 - e2 * sin_phi1**2)
+    r1 = _WGS84_A * (1 - e2) / (1 - e2 * sin_phi1**2) ** 1.5
+    d = (x - 500000.0) / (n1 * k0)
+    phi = phi1 - (n1 * np.tan(phi1) / r1) * (
+        d**2 / 2
+        - (5 + 3 * t1 + 10 * c1 - 4 * c1**2 - 9 * ep2) * d**4 / 24
+        + (61 + 90 * t1 + 298 * c1 + 45 * t1**2 - 252 * ep2 - 3 * c1**2)
+        * d**6
+        / 720
+    )
+    lam = lam0 + (
+        d
+        - (1 + 2 * t1 + c1) * d**3 / 6
+        + (5 - 2 * c1 + 28 * t1 - 3 * c1**2 + 8 * ep2 + 24 * t1**2)
+        * d**5
+        / 120
+    ) / cos_phi1
+    return np.degrees(lam), np.degrees(phi)
+
+
+def _polar_t_m(phi):
+    """Snyder's t and m auxiliaries for polar stereographic."""
+    e = _WGS84_E
+    sin_phi = np.sin(phi)
+    t = np.tan(np.pi / 4 - phi / 2) / (
+        (1 - e * sin_phi) / (1 + e * sin_phi)
+    ) ** (e / 2)
+    m = np.cos(phi) / np.sqrt(1 - _WGS84_E2 * sin_phi**2)
+    return t, m
+
+
+def _polar_forward(lon, lat, epsg):
+    """WGS84 lon/lat arrays to polar stereographic easting/northing."""
+    lat_ts, lon0, sign = _POLAR_PARAMS[epsg]
+    # The south pole aspect reuses the north formulas with negated
+    # latitude/longitude and negated output coordinates
+    phi = np.radians(sign * lat)
+    lam = np.radians(sign * lon) - np.radians(sign * lon0)
+    t, _ = _polar_t_m(phi)
+    tc, mc = _polar_t_m(np.radians(abs(lat_ts)))
+    rho = _WGS84_A * mc * t / tc
+    x = sign * rho * np.sin(lam)
+    y = sign * -rho * np.cos(lam)
+    return x, y
+
+
+def _polar_inverse(x, y, epsg):
+    """Polar stereographic easting/northing arrays to WGS84 lon/lat."""
+    lat_ts, lon0, sign = _POLAR_PARAMS[epsg]
+    e = _WGS84_E
+    x = sign * x
+    y = sign * y
+    rho = np.hypot(x, y)
+    tc, mc = _polar_t_m(np.radians(abs(lat_ts)))
+    t = rho * tc / (_WGS84_A * mc)
+    # Snyder's fixed-point iteration converges in a handful of rounds
+    phi = np.pi / 2 - 2 * np.arctan(t)
+    for _ in range(5):
+        sin_phi = np.sin(phi)
+        phi = np.pi / 2 - 2 * np.arctan(
+            t * ((1 - e * sin_phi) / (1 + e * sin_phi)) ** (e / 2)
+        )
+    lam = np.arctan2(x, -y)
+    return (
+        sign * np.degrees(lam) + lon0,
+        sign * np.degrees(phi),
+    )
+
+
+def _fast_to_crs(gdf, epsg):
+    """Reprojects with vectorized NumPy math for recognized CRS pairs.
+
+    Supports WGS84 lon/lat (EPSG:4326) to/from UTM (EPSG:326xx/327xx)
+    and the polar stereographic grids EPSG:3413/3031. Returns None for
+    unsupported pairs so the caller can fall back to GeoDataFrame.to_crs.
+
+    Accuracy versus PROJ: the polar stereographic formulas agree to
+    sub-millimeter; the UTM series diverges by up to roughly a
+    centimeter near zone edges and at high latitudes, which is well
+    below display resolution but not survey grade.
+    """
+    if gdf.crs is None:
+        return None
+    src = gdf.crs.to_epsg()
+    if src is None:
+        return None
+    forward = src == 4326 and _is_fast_epsg(epsg)
+    inverse = epsg == 4326 and _is_fast_epsg(src)
+    if not (forward or inverse):
+        return None
+
+    geoms = gdf.geometry.to_numpy()
+    coords = shapely.get_coordinates(geoms)
+    if forward:
+        if epsg in _POLAR_PARAMS:
+            x, y = _polar_forward(coords[:, 0], coords[:, 1], epsg)
+        else:
+            x, y = _utm_forward(coords[:, 0], coords[:, 1], epsg)
+    else:
+        if src in _POLAR_PARAMS:
+            x, y = _polar_inverse(coords[:, 0], coords[:, 1], src)
+        else:
+            x, y = _utm_inverse(coords[:, 0], coords[:, 1], src)
+
+    new_geoms = shapely.set_coordinates(
+        geoms.copy(), np.column_stack([x, y])
+    )
+    out = gdf.copy()
+    out["geometry"] = gpd.GeoSeries(
+        new_geoms, index=gdf.index, crs=f"EPSG:{epsg}"
+    )
+    return out
+
+
+# Table model for the attribute table
+
+
+class GeoDataFrameModel(QAbstractTableModel):
+    """Read-only table model over a GeoDataFrame's attribute columns.
+
+    Only the cells Qt actually paints are stringified, so the attribute
+    table opens in O(visible rows) instead of O(rows * columns).
+    """
+
+    def __init__(self, gdf, parent=None):
+        super().__init__(parent)
+        self._df = gdf.drop(columns="geometry", errors="ignore")
+        # Single ndarray so cell access is a C-level pointer lookup
+        self._values = self._df.to_numpy()
+        self._columns = list(self._df.columns)
+        # Qt calls rowCount/columnCount constantly while painting and
+        # scrolling; answer from plain ints
+        self._n_rows, self._n_cols = self._values.shape
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._n_rows
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._n_cols
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return str(self._columns[section])
+        return str(section + 1)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return str(self._values[index.row(), index.column()])
+        return None
+
+
+# Workers for running IO and compute off the GUI thread
+
+
+class _WorkerSignals(QObject):
+    finished = pyqtSignal(object)
+    error = pyqtSignal(str)
+
+
+class _IOWorker(QRunnable):
+    """Runs a callable on the global thread pool and signals the result."""
+
+    def __init__(self, func):
+        super().__init__()
+        self.func = func
+        self.signals = _WorkerSignals()
+
+    def run(self):
+        try:
+            self.signals.finished.emit(self.func())
+        except Exception as e:
+            self.signals.error.emit(str(e))
+
+
+# Worker thread for reading vector files off the GUI thread
+
+
+class ShapefileLoader(QThread):
+    """Reads a vector file on a worker thread, chunking very large files.
+
+    Files over CHUNK_THRESHOLD bytes are read in batches through pyogrio
+    so peak memory stays bounded and progress can be reported while the
+    Qt event loop keeps running.
+    """
+
+    progress = pyqtSignal(int, int)  # features read, total features
+    loaded = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    CHUNK_THRESHOLD = 256 * 1024 * 1024  # bytes
+    CHUNK_SIZE = 100000  # features per batch
+
+    def __init__(self, path, parent=None):
+        super().__init__(parent)
+        self.path = path
+
+    def run(self):
+        try:
+            self.loaded.emit(self._read())
+        except Exception as e:
+            self.failed.emit(str(e))
+
+    def _read(self):
+        # Repeat opens hit the columnar GeoParquet cache, which reads
+        # much faster than the text-encoded .shp/.geojson parsers
+        cache_path = _cached_parquet_path(self.path)
+        if os.path.exists(cache_path):
+            try:
+                return gpd.read_parquet(cache_path)
+            except Exception:
+                os.remove(cache_path)  # unreadable cache entry
+
+        gdf = self._read_source()
+        try:
+            os.makedirs(_CACHE_DIR, exist_ok=True)
+            gdf.to_parquet(cache_path)
+        except Exception as e:
+            # The cache is best-effort; keep the loaded data regardless
+            logging.error(f"Failed to write parquet cache: {e}")
+        return gdf
+
+    def _read_source(self):
+        if (
+            not _HAS_PYOGRIO
+            or os.path.getsize(self.path) <= self.CHUNK_THRESHOLD
+        ):
+            return read_vector_file(self.path)
+
+        # Incremental read: amortizes IO and bounds peak memory
+        total = pyogrio.read_info(self.path)["features"]
+        batches = []
+        for start in range(0, total, self.CHUNK_SIZE):
+            batches.append(
+                pyogrio.read_dataframe(
+                    self.path,
+                    skip_features=start,
+                    max_features=self.CHUNK_SIZE,
+                )
+            )
+            self.progress.emit(min(start + self.CHUNK_SIZE, total), total)
+        return gpd.GeoDataFrame(
+            pd.concat(batches, ignore_index=True), crs=batches[0].crs
+        )
+
+
 # File import class
 
 
@@ -82,22 +672,44 @@ class ImportFile:
             parent, "Import Shapefile", "", "Shapefiles (*.shp *.geojson)"
         )
 
-        if file_path:
-            try:
-                # Read the file and return the GeoDataFrame
-                gdf = gpd.read_file(file_path)
-                return gdf, file_path
-            except IOError:
-                QMessageBox.critical(
-                    parent, "Error", "Error reading the file."
-                )
-            except Exception as e:
-                # Catch any other unexpected errors
-                QMessageBox.critical(
-                    parent, "Error", f"An unexpected error occurred: {e}"
-                )
+        if not file_path:
+            return None, None
+
+        # Read on a worker thread so the window stays responsive; a local
+        # event loop blocks this call until the worker finishes
+        loader = ShapefileLoader(file_path)
+        result = {"gdf": None, "error": None}
+        loop = QEventLoop()
+
+        def on_progress(done, total):
+            parent.welcome_label.setText(
+                f"Loading features: {done}/{total}"
+            )
+
+        def on_loaded(gdf):
+            result["gdf"] = gdf
+            loop.quit()
+
+        def on_failed(message):
+            result["error"] = message
+            loop.quit()
+
+        loader.progress.connect(on_progress)
+        loader.loaded.connect(on_loaded)
+        loader.failed.connect(on_failed)
+        loader.start()
+        loop.exec_()
+        loader.wait()
+
+        if result["error"] is not None:
+            QMessageBox.critical(
+                parent,
+                "Error",
+                f"An unexpected error occurred: {result['error']}",
+            )
+            return None, None
 
-        return None, None
+        return result["gdf"], file_path
 
 
 # Operations class to handle GIS data functionalities
@@ -106,12 +718,64 @@ class Operations:
         self.main_window = main_window
         # self.gdf = None  # The currently opened GeoDataFrame
 
+        # State for the debounced viewport re-plot (matplotlib path)
+        self._view_ax = None
+        self._viewport_timer_pending = False
+        self._in_viewport_replot = False
+
+        # Keeps thread-pool workers alive until their signals fire
+        self._workers = []
+
+        # Currently connected label-visibility slot (pyqtgraph path)
+        self._label_slot = None
+
+    def _drop_label_callback(self):
+        """Disconnects the previous label-visibility slot, if any.
+
+        clear_map() only removes items from the scene; without this the
+        sigRangeChanged connection would keep the removed TextItems
+        alive and fire dead work on every pan/zoom.
+        """
+        if self._label_slot is None:
+            return
+        try:
+            self.main_window.canvas.getViewBox().sigRangeChanged.disconnect(
+                self._label_slot
+            )
+        except TypeError:
+            pass
+        self._label_slot = None
+
+    def _run_async(self, func, on_done, error_title):
+        """Runs func on the thread pool so the event loop keeps running.
+
+        on_done receives the result on the GUI thread; failures are
+        reported in a message box prefixed with error_title.
+        """
+        worker = _IOWorker(func)
+
+        def finished(result):
+            self._workers.remove(worker)
+            on_done(result)
+
+        def failed(message):
+            self._workers.remove(worker)
+            QMessageBox.critical(
+                self.main_window, "Error", f"{error_title}: {message}"
+            )
+
+        worker.signals.finished.connect(finished)
+        worker.signals.error.connect(failed)
+        self._workers.append(worker)
+        QThreadPool.globalInstance().start(worker)
+
     def open_file(self):
         gdf, file_path = self.main_window.importer.import_shapefile(
             self.main_window
         )
         if gdf is not None:
             self.main_window.gdf = gdf
+            self._cache_layer_metadata(gdf)
             self.main_window.welcome_label.setText(f"Opened file: {file_path}")
             self.display_gis_data()
         else:
@@ -119,6 +783,78 @@ class Operations:
         # Update Operations menu state after opening file
         self.main_window.update_operations_menu_state()
 
+    def _cache_layer_metadata(self, gdf):
+        """Caches total_bounds and the CRS string so redraws are O(1).
+
+        total_bounds walks every geometry on each access; memoizing it
+        here avoids recomputing the envelope four times per redraw.
+        """
+        self.main_window._bounds = tuple(gdf.total_bounds)
+        self.main_window._crs_str = (
+            gdf.crs.to_string() if gdf.crs else "Undefined projection"
+        )
+
+    def _get_plot_gdf(self):
+        """Returns a simplified copy of the GeoDataFrame for plotting.
+
+        Geometries are simplified at a canvas-pixel tolerance so matplotlib
+        receives far fewer vertices with no visible difference. The result
+        is cached on the main window so repeated redraws reuse it.
+        """
+        gdf = self.main_window.gdf
+        if len(gdf) < 500:
+            return gdf
+        xmin, ymin, xmax, ymax = (
+            self.main_window._bounds
+            if self.main_window._bounds is not None
+            else gdf.total_bounds
+        )
+        canvas = self.main_window.canvas
+        tol = max(xmax - xmin, ymax - ymin) / max(
+            canvas.width(), canvas.height(), 1
+        )
+        key = (id(gdf), tol)
+        if self.main_window._plot_cache_key != key:
+            plot_gdf = gdf.copy()
+            plot_gdf["geometry"] = gdf.geometry.simplify(
+                tol, preserve_topology=True
+            )
+            self.main_window._plot_gdf = plot_gdf
+            self.main_window._plot_cache_key = key
+        return self.main_window._plot_gdf
+
+    def _plot_batched(self, ax, plot_gdf):
+        """Draws the layer as a single matplotlib collection when possible.
+
+        One PolyCollection/LineCollection is rendered with a single
+        draw_path_collection call instead of one artist per feature;
+        mixed-type layers fall back to GeoDataFrame.plot.
+        """
+        geom_types = set(plot_gdf.geom_type)
+        if geom_types <= {"Polygon", "MultiPolygon"}:
+            verts = [
+                np.asarray(part.exterior.coords)
+                for geom in plot_gdf.geometry
+                if geom is not None and not geom.is_empty
+                for part in getattr(geom, "geoms", [geom])
+            ]
+            coll = PolyCollection(
+                verts, facecolors="#4C78A8", edgecolors="none"
+            )
+        elif geom_types <= {"LineString", "MultiLineString"}:
+            segments = [
+                np.asarray(part.coords)
+                for geom in plot_gdf.geometry
+                if geom is not None and not geom.is_empty
+                for part in getattr(geom, "geoms", [geom])
+            ]
+            coll = LineCollection(segments, colors="#4C78A8")
+        else:
+            plot_gdf.plot(ax=ax)
+            return
+        ax.add_collection(coll)
+        ax.autoscale_view()
+
     def display_gis_data(self):
         """Displays GIS data on the canvas."""
         if self.main_window.gdf is None:
@@ -127,36 +863,94 @@ class Operations:
             )
             return
         try:
-            self.main_window.figure.clear()  # Clear the figure
-            ax = self.main_window.figure.add_subplot(
-                111
-            )  # Create a new subplot
-            self.main_window.gdf.plot(ax=ax)
-            ax.axis("on")
-            ax.set_xlim(
-                self.main_window.gdf.total_bounds[0],
-                self.main_window.gdf.total_bounds[2],
-            )
-            ax.set_ylim(
-                self.main_window.gdf.total_bounds[1],
-                self.main_window.gdf.total_bounds[3],
-            )
-            ax.tick_params(axis="x", labelsize=14)
-            ax.tick_params(axis="y", labelsize=14)
-            self.main_window.canvas.draw()
+            if self.main_window.use_pyqtgraph:
+                self._drop_label_callback()
+                self.main_window.canvas.draw_geodataframe(
+                    self._get_plot_gdf()
+                )
+                xmin, ymin, xmax, ymax = self.main_window._bounds
+                self.main_window.canvas.setRange(
+                    xRange=(xmin, xmax), yRange=(ymin, ymax), padding=0
+                )
+                return
+
+            # Block intermediate repaints while the figure is rebuilt, then
+            # coalesce everything into a single deferred draw
+            self.main_window.canvas.setUpdatesEnabled(False)
+            try:
+                # Reuse the persistent Axes; cla() resets its artists and
+                # callbacks without tearing down the whole figure
+                ax = self.main_window.ax
+                ax.cla()
+                self._plot_batched(ax, self._get_plot_gdf())
+                ax.axis("on")
+                xmin, ymin, xmax, ymax = self.main_window._bounds
+                ax.set_xlim(xmin, xmax)
+                ax.set_ylim(ymin, ymax)
+                ax.tick_params(axis="x", labelsize=14)
+                ax.tick_params(axis="y", labelsize=14)
+
+                # Re-plot only the features in view after pan/zoom; the
+                # spatial index is cached on the GeoDataFrame itself
+                self._view_ax = ax
+                self.main_window._sindex = self.main_window.gdf.sindex
+                ax.callbacks.connect(
+                    "xlim_changed", self._schedule_viewport_replot
+                )
+                ax.callbacks.connect(
+                    "ylim_changed", self._schedule_viewport_replot
+                )
+            finally:
+                self.main_window.canvas.setUpdatesEnabled(True)
+                self.main_window.canvas.draw_idle()
         except Exception as e:
             QMessageBox.critical(
                 self.main_window, "Error", f"Failed to display GIS data: {e}"
             )
 
+    def _schedule_viewport_replot(self, ax):
+        """Debounces viewport re-plots so continuous zoom fires one query."""
+        if self._viewport_timer_pending or self._in_viewport_replot:
+            return
+        self._viewport_timer_pending = True
+        QTimer.singleShot(100, self._replot_viewport)
+
+    def _replot_viewport(self):
+        """Re-plots only the features intersecting the current viewport."""
+        self._viewport_timer_pending = False
+        ax = self._view_ax
+        gdf = self.main_window.gdf
+        if ax is None or gdf is None:
+            return
+        self._in_viewport_replot = True
+        try:
+            x_min, x_max = ax.get_xlim()
+            y_min, y_max = ax.get_ylim()
+            # O(log N + k) index query instead of handing matplotlib
+            # every geometry regardless of zoom level
+            idx = self.main_window._sindex.query(
+                box(x_min, y_min, x_max, y_max), predicate="intersects"
+            )
+            for artist in (
+                list(ax.collections) + list(ax.patches) + list(ax.lines)
+            ):
+                artist.remove()
+            if len(idx):
+                self._plot_batched(ax, self._get_plot_gdf().iloc[idx])
+            # Plotting autoscales; restore the user's view
+            ax.set_xlim(x_min, x_max)
+            ax.set_ylim(y_min, y_max)
+            self.main_window.canvas.draw_idle()
+        except Exception as e:
+            logging.error(f"Viewport re-plot failed: {e}", exc_info=True)
+        finally:
+            self._in_viewport_replot = False
+
     def show_projection_info(self):
         """Displays the projection information."""
         try:
-            projection_info = (
-                self.main_window.gdf.crs.to_string()
-                if self.main_window.gdf.crs
-                else "Undefined projection"
-            )
+            # Cached when the layer was loaded/reprojected/clipped
+            projection_info = self.main_window._crs_str
 
             # Create a dialog to display the projection information
             # Use the main window as the parent
@@ -176,8 +970,9 @@ class Operations:
             # Add a copy button
             copy_button = QPushButton("Copy", dialog)
             copy_button.clicked.connect(
-                lambda: self.copy_to_clipboard(text_edit.toPlainText())
-            )  # Connect to copy function
+                lambda: self.copy_to_clipboard(projection_info)
+            )  # Copy the cached string; toPlainText() would rebuild it
+            # from the QTextDocument tree on every click
             layout.addWidget(copy_button)
 
             # Add a close button
@@ -199,8 +994,7 @@ class Operations:
 
     def copy_to_clipboard(self, text):
         """Copy the text to clipboard."""
-        clipboard = QApplication.clipboard()  # Get the clipboard
-        clipboard.setText(text)  # Copy the text
+        self.main_window._clipboard.setText(text)  # Copy the text
 
     def switch_projection(self):
         """Switch projection based on user input EPSG code."""
@@ -215,13 +1009,26 @@ class Operations:
                 return
 
             epsg_code = int(epsg_code)
-            self.main_window.gdf = self.main_window.gdf.to_crs(
-                epsg=f"{epsg_code}"
-            )
-            self.main_window.welcome_label.setText(
-                f"Projection switched to EPSG:{epsg_code}"
-            )
-            self.display_gis_data()
+            gdf = self.main_window.gdf
+
+            def reproject():
+                # Use the closed-form NumPy path for recognized CRS
+                # pairs; fall back to pyproj for everything else
+                new_gdf = _fast_to_crs(gdf, epsg_code)
+                if new_gdf is None:
+                    new_gdf = gdf.to_crs(epsg=f"{epsg_code}")
+                return new_gdf
+
+            def on_done(new_gdf):
+                self.main_window.gdf = new_gdf
+                self._cache_layer_metadata(new_gdf)
+                self.main_window.welcome_label.setText(
+                    f"Projection switched to EPSG:{epsg_code}"
+                )
+                self.display_gis_data()
+
+            # Reproject off the GUI thread so the window stays responsive
+            self._run_async(reproject, on_done, "Failed to switch projection")
         except Exception as e:
             QMessageBox.warning(
                 self.main_window, "Error", f"Failed to switch projection: {e}"
@@ -246,33 +1053,53 @@ class Operations:
         if not clip_path:
             return
 
-        try:
+        gdf = self.main_window.gdf
+
+        def do_clip():
             # Check file type and perform clipping
             if clip_path.endswith((".shp", ".geojson")):
-                clip_gdf = gpd.read_file(clip_path)
-                self.main_window.gdf = self.main_window.gdf.clip(clip_gdf)
+                # Push the spatial filter down into the driver so only
+                # features intersecting the current layer are read
+                bounds = self.main_window._bounds
+                clip_gdf = read_vector_file(clip_path, bbox=bounds)
+                # Numba fast path for simple convex clip windows
+                clipped = _clip_convex_fast(gdf, clip_gdf)
+                if clipped is not None:
+                    return clipped
+                return _clip_vectorized(gdf, clip_gdf)
             elif clip_path.endswith((".tif", ".tiff")):
                 import rasterio
                 from rasterio.mask import mask
 
                 with rasterio.open(clip_path) as src:
                     bbox = src.bounds
-                    self.main_window.gdf = self.main_window.gdf.cx[
-                        bbox.left : bbox.right, bbox.bottom : bbox.top
-                    ]
+                    # Prune to the raster footprint via the spatial index
+                    # instead of the slower .cx coordinate slice; the
+                    # predicate keeps the true intersection test .cx did,
+                    # and sorting preserves the original row order
+                    idx = gdf.sindex.query(
+                        box(bbox.left, bbox.bottom, bbox.right, bbox.top),
+                        predicate="intersects",
+                    )
+                    return gdf.iloc[np.sort(idx)]
+            return gdf
 
+        def on_done(clipped):
+            self.main_window.gdf = clipped
+            self._cache_layer_metadata(clipped)
             self.display_gis_data()
             QMessageBox.information(
                 self.main_window, "Clip Data", "Data clipped successfully."
             )
-        except Exception as e:
-            QMessageBox.critical(
-                self.main_window, "Error", f"Failed to clip data: {e}"
-            )
+
+        # Clip off the GUI thread so the window stays responsive
+        self._run_async(do_clip, on_done, "Failed to clip data")
 
     def show_attribute_table(self):
         """Displays the attribute table of the currently loaded GeoDataFrame in a dialog."""
-        if self.main_window.gdf is None:
+        # Bind the frame once instead of repeated attribute lookups
+        gdf = self.main_window.gdf
+        if gdf is None:
             QMessageBox.warning(
                 self.main_window, "Warning", "No GIS file is opened."
             )
@@ -284,21 +1111,14 @@ class Operations:
         dialog.setWindowFlag(Qt.WindowMaximizeButtonHint)
         layout = QVBoxLayout(dialog)
 
-        # Create the table widget to display the attributes
-        table = QTableWidget(dialog)
-        gdf = self.main_window.gdf
-
-        # Set the table dimensions
-        table.setColumnCount(len(gdf.columns))
-        table.setRowCount(len(gdf))
-        table.setHorizontalHeaderLabels(gdf.columns)
+        # Create a virtualized view over the attributes; cells are only
+        # materialized when Qt paints them
+        view = QTableView(dialog)
+        view.setModel(GeoDataFrameModel(gdf, dialog))
+        # Uniform row heights avoid per-row size queries on scroll
+        view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
 
-        # Populate the table with GeoDataFrame data
-        for i in range(len(gdf)):
-            for j, column in enumerate(gdf.columns):
-                table.setItem(i, j, QTableWidgetItem(str(gdf.iloc[i, j])))
-
-        layout.addWidget(table)
+        layout.addWidget(view)
         close_button = QPushButton("Close", dialog)
         close_button.clicked.connect(dialog.accept)
         layout.addWidget(close_button)
@@ -309,14 +1129,16 @@ class Operations:
 
     def label_features(self):
         """Displays labels for each feature based on a selected field."""
-        if self.main_window.gdf is None:
+        # Bind the frame once instead of repeated attribute lookups
+        gdf = self.main_window.gdf
+        if gdf is None:
             QMessageBox.warning(
                 self.main_window, "Warning", "No GIS file is opened."
             )
             return
 
         # Get the columns from the attribute table
-        columns = self.main_window.gdf.columns.tolist()
+        columns = list(gdf.columns)
 
         # Prompt the user to select a field for labeling
         field, ok = QInputDialog.getItem(
@@ -329,53 +1151,130 @@ class Operations:
         )
 
         if ok and field:
+            if self.main_window.use_pyqtgraph:
+                self._label_features_pyqtgraph(field)
+                return
             try:
-                self.main_window.figure.clear()
-                ax = self.main_window.figure.add_subplot(111)
-
-                # Plot the geometries
-                self.main_window.gdf.plot(ax=ax)
-
-                # Store text labels in a list for later visibility control
-                labels = []
-                for idx, row in self.main_window.gdf.iterrows():
-                    centroid = row["geometry"].centroid
-                    label = ax.text(
-                        centroid.x,
-                        centroid.y,
-                        str(row[field]),
-                        fontsize=8,
-                        ha="center",
+                # Block intermediate repaints while geometries and
+                # labels are added, then coalesce into one deferred draw
+                self.main_window.canvas.setUpdatesEnabled(False)
+                try:
+                    # Reuse the persistent Axes instead of rebuilding it
+                    ax = self.main_window.ax
+                    ax.cla()
+
+                    # Plot the geometries
+                    self._get_plot_gdf().plot(ax=ax)
+
+                    # Compute all centroids through the shapely ufuncs:
+                    # one C loop over the underlying GEOS geometries
+                    # with no per-row Python wrappers
+                    centroids = shapely.centroid(
+                        np.asarray(gdf.geometry.values)
+                    )
+                    xs = shapely.get_x(centroids)
+                    ys = shapely.get_y(centroids)
+                    texts = gdf[field].astype(str).to_numpy()
+
+                    # Store label artists as an object array alongside the
+                    # coordinate arrays for later visibility control
+                    label_objects = np.array(
+                        [
+                            ax.text(
+                                xs[i], ys[i], texts[i], fontsize=8, ha="center"
+                            )
+                            for i in range(len(xs))
+                        ],
+                        dtype=object,
                     )
-                    labels.append((centroid, label))
-
-                # Define a function to update label visibility based on axis
-                # limits
-                def update_label_visibility(event):
-                    x_min, x_max = ax.get_xlim()
-                    y_min, y_max = ax.get_ylim()
-                    for centroid, label in labels:
-                        # Check if the centroid is within the visible axis
-                        # limits
-                        visible = (x_min <= centroid.x <= x_max) and (
-                            y_min <= centroid.y <= y_max
-                        )
-                        label.set_visible(visible)
-
-                # Connect the update function to the axes limits change event
-                ax.callbacks.connect("xlim_changed", update_label_visibility)
-                ax.callbacks.connect("ylim_changed", update_label_visibility)
-
-                # Initial call to set label visibility
-                update_label_visibility(None)
 
-                # Update the canvas
-                self.main_window.canvas.draw()
+                    # Labels are created visible; track their state so pan/zoom
+                    # only touches the ones whose visibility actually changed
+                    prev = np.ones(len(xs), dtype=bool)
+                    self._last_xlim = None
+                    self._last_ylim = None
+
+                    # Define a function to update label visibility based on axis
+                    # limits
+                    def update_label_visibility(event):
+                        x_lim = ax.get_xlim()
+                        y_lim = ax.get_ylim()
+                        # Skip the redundant second callback per pan/zoom event
+                        # (xlim_changed and ylim_changed both fire)
+                        if x_lim == self._last_xlim and y_lim == self._last_ylim:
+                            return
+                        self._last_xlim = x_lim
+                        self._last_ylim = y_lim
+                        x_min, x_max = x_lim
+                        y_min, y_max = y_lim
+                        # Compute visibility for all centroids in one NumPy mask
+                        visible = (
+                            (xs >= x_min)
+                            & (xs <= x_max)
+                            & (ys >= y_min)
+                            & (ys <= y_max)
+                        )
+                        for i in np.where(visible != prev)[0]:
+                            label_objects[i].set_visible(bool(visible[i]))
+                        prev[:] = visible
+
+                    # Connect the update function to the axes limits change event
+                    ax.callbacks.connect("xlim_changed", update_label_visibility)
+                    ax.callbacks.connect("ylim_changed", update_label_visibility)
+
+                    # Initial call to set label visibility
+                    update_label_visibility(None)
+                finally:
+                    self.main_window.canvas.setUpdatesEnabled(True)
+                    self.main_window.canvas.draw_idle()
             except Exception as e:
                 QMessageBox.critical(
                     self.main_window, "Error", f"Failed to display labels: {e}"
                 )
 
+    def _label_features_pyqtgraph(self, field):
+        """Labels features on the pyqtgraph canvas for the given field."""
+        try:
+            gdf = self.main_window.gdf
+            canvas = self.main_window.canvas
+            canvas.draw_geodataframe(self._get_plot_gdf())
+
+            # Compute all centroids through the shapely ufuncs
+            centroids = shapely.centroid(np.asarray(gdf.geometry.values))
+            xs = shapely.get_x(centroids)
+            ys = shapely.get_y(centroids)
+            texts = gdf[field].astype(str).to_numpy()
+            label_objects = canvas.add_labels(xs, ys, texts)
+
+            # Labels are created visible; only touch the ones whose
+            # visibility changes when the view range moves
+            prev = np.ones(len(xs), dtype=bool)
+
+            def update_label_visibility(view_box, ranges):
+                (x_min, x_max), (y_min, y_max) = ranges
+                visible = (
+                    (xs >= x_min)
+                    & (xs <= x_max)
+                    & (ys >= y_min)
+                    & (ys <= y_max)
+                )
+                for i in np.where(visible != prev)[0]:
+                    label_objects[i].setVisible(bool(visible[i]))
+                prev[:] = visible
+
+            # Replace any previously connected slot instead of stacking
+            self._drop_label_callback()
+            view_box = canvas.getViewBox()
+            view_box.sigRangeChanged.connect(update_label_visibility)
+            self._label_slot = update_label_visibility
+
+            # Initial call to set label visibility
+            update_label_visibility(view_box, view_box.viewRange())
+        except Exception as e:
+            QMessageBox.critical(
+                self.main_window, "Error", f"Failed to display labels: {e}"
+            )
+
 
 # Menu and toolbar manager class
 class Menus:
@@ -436,25 +1335,90 @@ class Menus:
 
 
 class CustomNavigationToolbar(NavigationToolbar):
+    _icon_paths = {
+        "Home": r"icons\home.png",
+        "Back": r"icons\pfanhui.png",
+        "Forward": r"icons\pforward.png",
+        "Pan": r"icons\pan.png",
+        "Zoom": r"icons\zoom-extent.png",
+        "Subplots": r"icons\edit-border.png",
+        "Customize": r"icons\edit-text.png",
+        "Save": r"icons\save.png",
+    }
+    # Icons are loaded from disk once and shared by every toolbar instance
+    _icon_cache = {}
+
     def __init__(self, canvas, parent, coordinates=True):
         super().__init__(canvas, parent, coordinates)
-        self._icon_paths = {
-            "Home": r"icons\home.png",
-            "Back": r"icons\pfanhui.png",
-            "Forward": r"icons\pforward.png",
-            "Pan": r"icons\pan.png",
-            "Zoom": r"icons\zoom-extent.png",
-            "Subplots": r"icons\edit-border.png",
-            "Customize": r"icons\edit-text.png",
-            "Save": r"icons\save.png",
-        }
         self._update_icons()
 
     def _update_icons(self):
+        cache = CustomNavigationToolbar._icon_cache
         for action in self.actions():
-            if action.text() in self._icon_paths:
-                icon_path = self._icon_paths[action.text()]
-                action.setIcon(QIcon(icon_path))
+            name = action.text()
+            if name in self._icon_paths:
+                icon = cache.setdefault(name, QIcon(self._icon_paths[name]))
+                action.setIcon(icon)
+
+
+# Map canvas backed by pyqtgraph (only defined when the library exists)
+
+
+if _HAS_PYQTGRAPH:
+
+    class MapCanvas(pg.PlotWidget):
+        """Map view rendered through pyqtgraph's Qt-native scene graph.
+
+        Pan/zoom only repaints dirty regions instead of re-rasterizing
+        the whole figure through Agg like the matplotlib canvas does.
+        """
+
+        def __init__(self, parent=None):
+            super().__init__(parent)
+            self.setAspectLocked(False)
+            self._geom_items = []
+            self._label_items = []
+
+        def clear_map(self):
+            """Removes all geometry and label items from the view."""
+            self.clear()
+            self._geom_items = []
+            self._label_items = []
+
+        def draw_geodataframe(self, gdf):
+            """Draws each geometry as a PlotDataItem built from its coords."""
+            self.clear_map()
+            pen = pg.mkPen("#4C78A8")
+            for geom in gdf.geometry:
+                if geom is None or geom.is_empty:
+                    continue
+                # Flatten Multi* geometries into their parts
+                for part in getattr(geom, "geoms", [geom]):
+                    if part.geom_type == "Polygon":
+                        coords = np.asarray(part.exterior.coords)
+                    else:
+                        coords = np.asarray(part.coords)
+                    if part.geom_type == "Point":
+                        item = pg.ScatterPlotItem(
+                            x=coords[:, 0], y=coords[:, 1], pen=pen, size=4
+                        )
+                    else:
+                        item = pg.PlotDataItem(
+                            coords[:, 0], coords[:, 1], pen=pen
+                        )
+                    self.addItem(item)
+                    self._geom_items.append(item)
+
+        def add_labels(self, xs, ys, texts):
+            """Adds one TextItem per centroid and returns the items."""
+            items = []
+            for x, y, text in zip(xs, ys, texts):
+                item = pg.TextItem(str(text), anchor=(0.5, 0.5))
+                item.setPos(float(x), float(y))
+                self.addItem(item)
+                items.append(item)
+            self._label_items = items
+            return items
 
 
 # UI MainWindow class
@@ -467,6 +1431,17 @@ class MainWindow(QMainWindow):
         # Initialize ImportFile class
         self.importer = ImportFile()
 
+        # Cache for the simplified plotting GeoDataFrame
+        self._plot_gdf = None
+        self._plot_cache_key = None
+
+        # Cached layer metadata (set whenever self.gdf is replaced)
+        self._bounds = None
+        self._crs_str = "Undefined projection"
+
+        # Fetch the application clipboard once instead of per copy
+        self._clipboard = QApplication.clipboard()
+
         # Setup window properties
         self.setWindowTitle("Banyan GIS - v1.3")
         self.setWindowIcon(QIcon(r"icons\banyantree.png"))
@@ -487,14 +1462,24 @@ class MainWindow(QMainWindow):
         )
         self.layout.addWidget(self.welcome_label)
 
-        # Matplotlib Figure and Canvas
-        self.figure = plt.Figure(figsize=(10, 8))
-        self.canvas = FigureCanvas(self.figure)
-        self.layout.addWidget(self.canvas)
+        # Map view: pyqtgraph when available, matplotlib otherwise
+        self.use_pyqtgraph = _HAS_PYQTGRAPH
+        if self.use_pyqtgraph:
+            self.figure = None
+            self.ax = None
+            self.canvas = MapCanvas(self)
+            self.layout.addWidget(self.canvas)
+        else:
+            # Matplotlib Figure and Canvas; the Axes is created once and
+            # reused so redraws don't rebuild ticks, spines and callbacks
+            self.figure = plt.Figure(figsize=(10, 8))
+            self.ax = self.figure.add_subplot(111)
+            self.canvas = FigureCanvas(self.figure)
+            self.layout.addWidget(self.canvas)
 
-        # Add Navigation Toolbar
-        self.toolbar = CustomNavigationToolbar(self.canvas, self)
-        self.layout.addWidget(self.toolbar)
+            # Add Navigation Toolbar (pyqtgraph has built-in mouse pan/zoom)
+            self.toolbar = CustomNavigationToolbar(self.canvas, self)
+            self.layout.addWidget(self.toolbar)
 
         # Initialize Operations class
         self.operations = Operations(self)
@@ -511,8 +1496,12 @@ class MainWindow(QMainWindow):
     def clear_canvas(self):
         """Clears the canvas at initialization."""
         self.gdf = None  # Reset to no opened file
-        self.figure.clear()  # Clear the figure at initialization
-        self.canvas.draw()  # Refresh the canvas to show it empty
+        if self.use_pyqtgraph:
+            self.canvas.clear_map()
+        else:
+            self.ax.cla()  # Clear the axes at initialization
+            self.ax.axis("off")
+            self.canvas.draw_idle()  # Refresh the canvas to show it empty
 
         # Update Operations menu state after clearing the canvas
         self.update_operations_menu_state()